@@ -175,6 +175,12 @@ class Product(db.Model):
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def count(cls) -> int:
+        """Returns the number of Products in the database"""
+        logger.info("Processing count of all Products")
+        return cls.query.count()
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID